@@ -1,155 +1,306 @@
-import requests
-from bs4 import BeautifulSoup
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
-from konlpy.tag import Okt
-from collections import Counter
-from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import os
-import logging
-
-# ✅ 로깅 설정
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
-
-# ✅ 기본 설정값
-BASE_URL = "https://news.naver.com/main/list.naver?mode=LSD&mid=sec&sid1=101&date={date}&page={page}"
-
-# ✅ 불용어 리스트
-DEFAULT_STOPWORDS = {
-    "기자", "이", "그", "것", "저", "등", "및", "중", "대한", "이번", "관련",
-    "수", "더", "로", "위", "대해", "등의", "지난", "오늘", "내일", "올해",
-    "경우", "새로운", "뉴스", "경제", "보도", "대한민국", "정부", "금융", "시장",
-    "포토", "한국", "속보", "위해", "중앙", "서울", "대통령", "전국", "사람", "의원"
-}
-
-# ✅ 자동 제거에서 복원할 단어 리스트
-EXCLUDED_KEYWORDS = {"트럼프"}
-
-# ✅ 특정 날짜의 마지막 페이지 번호를 가져오는 함수
-def get_last_page(session, date):
-    """ 특정 날짜의 마지막 페이지 번호를 가져오는 함수 """
-    url = BASE_URL.format(date=date, page=1)
-    try:
-        response = session.get(url, timeout=5)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "lxml")
-
-        # ✅ 마지막 페이지 번호 찾기
-        page_numbers = [
-            int(a.get_text(strip=True)) for a in soup.select(".paging a")
-            if a.get_text(strip=True).isdigit()
-        ]
-        return max(page_numbers) if page_numbers else 5  # ✅ 기본값 5페이지
-
-    except requests.RequestException as e:
-        logging.error(f"❌ 페이지 수 확인 실패 ({date}): {e}")
-        return 5  # ✅ 오류 발생 시 기본 5페이지
-
-# ✅ 네이버 경제 뉴스 크롤링 함수 (병렬 처리)
-def fetch_news(session, date, page):
-    """ 특정 날짜와 페이지의 뉴스 제목을 가져오는 함수 """
-    url = BASE_URL.format(date=date, page=page)
-    try:
-        response = session.get(url, timeout=5)  # ✅ 5초 타임아웃 추가
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "lxml")
-
-        headlines = [
-            headline.get_text(strip=True)
-            for headline in soup.select(".list_body.newsflash_body li dt:not(.photo) a")
-        ]
-
-        return headlines if headlines else None
-
-    except requests.Timeout:
-        logging.error(f"⏳ 타임아웃 발생 ({date}, 페이지 {page})")
-        return None
-    except requests.RequestException as e:
-        logging.error(f"❌ 요청 실패 ({date}, 페이지 {page}): {e}")
-        return None
-
-# ✅ 기간별 크롤링 (동적 페이지 크롤링)
-def get_news_titles_by_date(start_date, end_date):
-    """ 특정 기간 동안의 네이버 경제 뉴스 기사 제목을 크롤링 (동적 페이지 처리) """
-    news_titles = []
-    max_workers = min(10, os.cpu_count() or 4)
-
-    with requests.Session() as session:
-        session.headers.update({"User-Agent": "Mozilla/5.0"})
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            tasks = []
-            date_cursor = start_date
-
-            while date_cursor <= end_date:
-                formatted_date = date_cursor.strftime("%Y%m%d")
-                logging.info(f"📅 {formatted_date} 뉴스 크롤링 중...")
-
-                # ✅ 첫 페이지 요청 및 마지막 페이지 확인
-                first_page_titles = fetch_news(session, formatted_date, 1)
-                if first_page_titles:
-                    news_titles.extend(first_page_titles)
-
-                    # ✅ 해당 날짜의 마지막 페이지 번호 가져오기
-                    last_page = get_last_page(session, formatted_date)
-
-                    # ✅ 2페이지부터 마지막 페이지까지 크롤링 (병렬 처리)
-                    tasks += [executor.submit(fetch_news, session, formatted_date, page) for page in range(2, last_page + 1)]
-
-                date_cursor += timedelta(days=1)
-
-            # ✅ 병렬 요청 결과 처리
-            for future in as_completed(tasks):
-                result = future.result()
-                if result:
-                    news_titles.extend(result)
-
-    return list(set(news_titles))  # ✅ 중복 제거
-
-# ✅ 워드 클라우드 생성 함수 (빈도수 높은 단어 자동 제거 추가, 예외 처리)
-def create_wordcloud(news_titles, top_n_stopwords=5):
-    """ 크롤링한 뉴스 제목을 활용하여 가독성 높은 워드 클라우드를 생성하는 함수 """
-    okt = Okt()
-
-    # ✅ 명사 추출 + 불용어 제거 + 한 글자 단어 제외
-    words = [noun for title in news_titles for noun in okt.nouns(title)
-             if noun not in DEFAULT_STOPWORDS and len(noun) > 1]
-
-    word_freq = Counter(words)
-
-    # ✅ 상위 N개 단어 자동 불용어 추가 (단, EXCLUDED_KEYWORDS는 제외)
-    common_words = {word for word, _ in word_freq.most_common(top_n_stopwords) if word not in EXCLUDED_KEYWORDS}
-    filtered_word_freq = {word: freq for word, freq in word_freq.items() if word not in common_words}
-
-    logging.info(f"🛑 자동으로 제외된 상위 {top_n_stopwords}개 단어 (단, {EXCLUDED_KEYWORDS} 제외): {common_words}")
-
-    # ✅ 개선된 워드 클라우드 설정
-    wordcloud = WordCloud(
-        font_path="C:/Windows/Fonts/malgun.ttf",
-        background_color="white",
-        width=1000,
-        height=600,
-        max_words=150,
-        colormap="Dark2",
-        prefer_horizontal=1.0,
-        relative_scaling=0.5
-    ).generate_from_frequencies(filtered_word_freq)
-
-    # ✅ 워드 클라우드 출력
-    plt.figure(figsize=(12, 6))
-    plt.imshow(wordcloud, interpolation="bilinear")
-    plt.axis("off")
-    plt.show()
-
-# ✅ 실행 코드
-if __name__ == "__main__":
-    start_date = datetime(2025, 1, 1)
-    end_date = datetime(2025, 2, 7)
-
-    news_titles = get_news_titles_by_date(start_date, end_date)
-
-    logging.info(f"\n📢 네이버 경제 뉴스 헤드라인 ({start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}):")
-    print("\n".join(f"{i + 1}. {title}" for i, title in enumerate(news_titles[:20])))
-
-    create_wordcloud(news_titles)
\ No newline at end of file
+import asyncio
+import aiohttp
+import lxml.html
+from lxml.cssselect import CSSSelector
+from wordcloud import WordCloud
+import matplotlib.pyplot as plt
+from konlpy.tag import Okt
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from itertools import islice
+from pathlib import Path
+import gzip
+import hashlib
+import logging
+import multiprocessing
+import os
+import re
+import time
+import zlib
+
+# ✅ Numba가 설치되어 있으면 명사 필터링/카운팅 루프를 네이티브 코드로 컴파일 (선택 사항)
+try:
+    import numpy as np
+    from numba import njit
+
+    @njit(cache=True)
+    def _count_ids(ids, keep_mask, out):
+        for i in range(ids.size):
+            x = ids[i]
+            if keep_mask[x]:
+                out[x] += 1
+        return out
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# ✅ xxhash가 설치되어 있으면 중복 제거 키로 SipHash보다 빠른 64비트 해시 사용 (선택 사항)
+try:
+    from xxhash import xxh3_64_intdigest as _title_key
+except ImportError:
+    _title_key = hash
+
+# ✅ 로깅 설정
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+# ✅ 기본 설정값 (날짜별 URL 앞부분은 f-string으로 1회 조립 후 페이지 번호만 이어 붙임)
+BASE_URL = "https://news.naver.com/main/list.naver?mode=LSD&mid=sec&sid1=101"
+
+# ✅ 미리 컴파일한 CSS 선택자 (페이지마다 CSS→XPath 변환을 반복하지 않음)
+_HEADLINE_SEL = CSSSelector(".list_body.newsflash_body li dt:not(.photo) a")
+
+# ✅ 미리 컴파일한 페이징 블록/번호 정규식 (DOM 탐색 없이 응답 바이트에서 바로 추출)
+_PAGE_BLOCK_RE = re.compile(rb'class="paging".*?</div>', re.S)
+_PAGE_NUM_RE = re.compile(rb">(\d+)<")
+
+# ✅ 미리 컴파일한 한글 외 문자 제거 정규식 (태거에 넘기기 전 기호/영문/숫자 노이즈 제거)
+_NON_HANGUL_RE = re.compile(r"[^가-힣 ]+")
+
+# ✅ 페이지 디스크 캐시 (불용어/워드클라우드 설정을 바꿔가며 재실행할 때 재크롤링 생략)
+_CACHE_DIR = Path(__file__).parent / ".naver_cache"
+_CACHE_EXPIRE_SECONDS = 3600
+
+def _cache_get(url):
+    """ URL의 캐시된 응답 바이트를 반환하는 함수 (없거나 만료/손상됐으면 None) """
+    path = _CACHE_DIR / (hashlib.md5(url.encode()).hexdigest() + ".gz")
+    try:
+        if time.time() - path.stat().st_mtime < _CACHE_EXPIRE_SECONDS:
+            return gzip.decompress(path.read_bytes())
+    except (OSError, EOFError, zlib.error):
+        pass  # ✅ 잘린 파일(EOFError)·손상 파일(zlib.error)도 캐시 미스로 처리
+    return None
+
+def _cache_put(url, body):
+    """ 응답 바이트를 gzip으로 압축해 캐시에 저장하는 함수 (실패해도 크롤링은 계속) """
+    try:
+        _CACHE_DIR.mkdir(exist_ok=True)
+        path = _CACHE_DIR / (hashlib.md5(url.encode()).hexdigest() + ".gz")
+        # ✅ 임시 파일에 쓴 뒤 원자적으로 교체 (중간에 끊겨도 반쪽짜리 캐시 파일이 남지 않음)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(gzip.compress(body))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.warning(f"⚠️ 캐시 저장 실패 ({url}): {e}")
+
+# ✅ 불용어 리스트 (불변 frozenset — 수정할 일이 없고 해시 조회 전용)
+DEFAULT_STOPWORDS = frozenset({
+    "기자", "이", "그", "것", "저", "등", "및", "중", "대한", "이번", "관련",
+    "수", "더", "로", "위", "대해", "등의", "지난", "오늘", "내일", "올해",
+    "경우", "새로운", "뉴스", "경제", "보도", "대한민국", "정부", "금융", "시장",
+    "포토", "한국", "속보", "위해", "중앙", "서울", "대통령", "전국", "사람", "의원"
+})
+
+# ✅ 자동 제거에서 복원할 단어 리스트 (불변 frozenset)
+EXCLUDED_KEYWORDS = frozenset({"트럼프"})
+
+# ✅ 형태소 분석기 싱글턴 (호출마다 JVM 재기동 + 사전 로딩을 하지 않도록 1회만 생성)
+_TAGGER = None
+
+def _get_tagger():
+    """ Okt 인스턴스를 최초 1회만 생성하고 이후 호출에서 재사용하는 함수 """
+    global _TAGGER
+    if _TAGGER is None:
+        _TAGGER = Okt()
+    return _TAGGER
+
+# ✅ 워드 클라우드 엔진 (호출마다 폰트 파일을 다시 열지 않도록 1회만 생성 후 재사용)
+_WORDCLOUD = WordCloud(
+    font_path="C:/Windows/Fonts/malgun.ttf",
+    background_color="white",
+    width=1000,
+    height=600,
+    max_words=150,
+    colormap="Dark2",
+    prefer_horizontal=1.0,
+    relative_scaling=0.5
+)
+
+# ✅ 네이버 경제 뉴스 크롤링 함수 (병렬 처리)
+async def fetch_news(session, url, date, page, parse_paging=False):
+    """ 미리 조립한 URL에서 뉴스 제목을 가져오는 함수 (date/page는 로그용)
+
+    parse_paging=True면 같은 HTML에서 마지막 페이지 번호까지 읽어
+    (제목 리스트, 마지막 페이지) 튜플을 반환 (추가 요청 없음)
+    """
+    # ✅ 디스크 캐시 적중 시 네트워크 요청 전체 생략
+    body = _cache_get(url)
+
+    if body is None:
+        try:
+            async with session.get(url) as response:
+                response.raise_for_status()
+                body = await response.read()
+            _cache_put(url, body)
+
+        except asyncio.TimeoutError:
+            logging.error(f"⏳ 타임아웃 발생 ({date}, 페이지 {page})")
+            return (None, 5) if parse_paging else None  # ✅ 실패 시 기본 5페이지
+        except aiohttp.ClientError as e:
+            logging.error(f"❌ 요청 실패 ({date}, 페이지 {page}): {e}")
+            return (None, 5) if parse_paging else None  # ✅ 실패 시 기본 5페이지
+
+    # ✅ 빈 응답은 파싱하지 않고 결과 없음 처리 (lxml은 빈 문서에서 ParserError 발생)
+    if not body.strip():
+        logging.warning(f"⚠️ 빈 응답 수신 ({date}, 페이지 {page})")
+        return (None, 5) if parse_paging else None
+
+    # ✅ 디코딩 없이 바이트를 lxml에 바로 전달 (str 변환 + 재인코딩 복사 제거)
+    tree = lxml.html.fromstring(body)
+
+    headlines = [
+        headline.text_content().strip()
+        for headline in _HEADLINE_SEL(tree)
+    ]
+
+    if parse_paging:
+        # ✅ 이미 받아온 1페이지 응답 바이트에서 정규식으로 마지막 페이지 번호 찾기
+        paging_block = _PAGE_BLOCK_RE.search(body)
+        page_numbers = [int(num) for num in _PAGE_NUM_RE.findall(paging_block.group(0))] if paging_block else []
+        last_page = max(page_numbers) if page_numbers else 5  # ✅ 기본값 5페이지
+        return (headlines if headlines else None), last_page
+
+    return headlines if headlines else None
+
+# ✅ 기간별 크롤링 (동적 페이지 크롤링)
+async def get_news_titles_by_date(start_date, end_date):
+    """ 특정 기간 동안의 네이버 경제 뉴스 기사 제목을 크롤링 (동적 페이지 처리) """
+    seen = {}  # ✅ 제목 해시 → 제목 dict로 수집 단계에서 바로 중복 제거 (64비트 해시 충돌은 무시 가능한 수준)
+
+    # ✅ 크롤링할 날짜 목록 생성
+    dates = []
+    date_cursor = start_date
+    while date_cursor <= end_date:
+        dates.append(date_cursor.strftime("%Y%m%d"))
+        date_cursor += timedelta(days=1)
+
+    # ✅ 시작일이 종료일보다 늦으면 크롤링할 날짜가 없으므로 빈 결과 반환
+    if not dates:
+        return seen.values()
+
+    # ✅ 연결 재사용(keep-alive) + DNS 캐시로 요청마다 TLS/DNS 비용을 내지 않도록 설정
+    connector = aiohttp.TCPConnector(
+        limit=64, limit_per_host=32, ttl_dns_cache=300, keepalive_timeout=60
+    )
+    # ✅ 소켓 단위 5초 제한 (total은 커넥션 풀 대기 시간까지 포함해 대량 fan-out 시 가짜 타임아웃 발생)
+    timeout = aiohttp.ClientTimeout(sock_connect=5, sock_read=5)
+
+    async with aiohttp.ClientSession(
+        connector=connector, timeout=timeout, headers={"User-Agent": "Mozilla/5.0"}
+    ) as session:
+        # ✅ 날짜별 URL 앞부분을 미리 조립 (페이지마다 str.format 템플릿 파싱 제거)
+        date_bases = {date: f"{BASE_URL}&date={date}&page=" for date in dates}
+
+        # ✅ 모든 날짜의 첫 페이지를 동시에 요청 (마지막 페이지 번호도 같은 응답에서 확인)
+        logging.info(f"📅 {dates[0]} ~ {dates[-1]} 뉴스 크롤링 중...")
+        first_pages = await asyncio.gather(
+            *[fetch_news(session, date_bases[date] + "1", date, 1, parse_paging=True) for date in dates]
+        )
+
+        # ✅ 2페이지부터 마지막 페이지까지 모든 날짜를 한 번에 병렬 요청
+        page_tuples = []
+        for date, (first_page_titles, last_page) in zip(dates, first_pages):
+            if first_page_titles:
+                for title in first_page_titles:
+                    seen.setdefault(_title_key(title), title)
+                page_tuples += [(date, page) for page in range(2, last_page + 1)]
+        results = await asyncio.gather(
+            *[fetch_news(session, date_bases[date] + str(page), date, page) for date, page in page_tuples]
+        )
+
+        for result in results:
+            if result:
+                for title in result:
+                    seen.setdefault(_title_key(title), title)
+
+    return seen.values()  # ✅ 이미 중복이 제거된 뷰 그대로 반환 (별도 복사 비용 없음)
+
+# ✅ 명사 빈도 집계 함수 (불용어 + 한 글자 단어 제외)
+def _count_filtered_nouns(nouns):
+    """ 불용어와 한 글자 단어를 제외한 명사 빈도를 Counter로 반환하는 함수
+
+    Numba가 있으면 단어를 정수 id로 인코딩한 뒤 네이티브 루프로 집계
+    """
+    if not _HAS_NUMBA:
+        # ✅ 순수 파이썬 경로 (제너레이터를 바로 Counter에 전달 — 중간 리스트 생성 없음)
+        return Counter(noun for noun in nouns
+                       if len(noun) > 1 and noun not in DEFAULT_STOPWORDS)
+
+    # ✅ 단어 → 정수 id 사전을 만들고 int32 배열로 인코딩
+    vocab = {}
+    ids = np.empty(len(nouns), np.int32)
+    for i, noun in enumerate(nouns):
+        ids[i] = vocab.setdefault(noun, len(vocab))
+
+    # ✅ 유지할 id 마스크 (불용어 아님 + 두 글자 이상)
+    keep_mask = np.empty(len(vocab), np.bool_)
+    for noun, idx in vocab.items():
+        keep_mask[idx] = len(noun) > 1 and noun not in DEFAULT_STOPWORDS
+
+    counts = _count_ids(ids, keep_mask, np.zeros(len(vocab), np.int64))
+    return Counter({noun: int(counts[idx]) for noun, idx in vocab.items() if counts[idx]})
+
+# ✅ 병렬 토크나이즈를 사용할 최소 제목 수 (워커별 JVM 기동 비용을 상쇄할 만큼 클 때만)
+_PARALLEL_MIN_TITLES = 5000
+
+# ✅ 워커 프로세스에서 실행되는 제목 묶음 단위 집계 함수
+def _count_titles_chunk(titles):
+    """ 제목 묶음을 명사 추출 + 빈도 집계하여 Counter로 반환하는 함수 (프로세스별 태거 재사용) """
+    tagger = _get_tagger()
+    # ✅ 한글 외 문자(기호, 영문, [속보] 류 괄호 등)를 미리 걷어내 태깅 입력을 줄임
+    text = _NON_HANGUL_RE.sub(" ", "\n".join(titles))
+    return _count_filtered_nouns(tagger.nouns(text))
+
+# ✅ 제목 전체의 명사 빈도 집계 (대량이면 CPU 코어별 프로세스로 분할)
+def _count_titles(news_titles):
+    """ 뉴스 제목 전체의 명사 빈도 Counter를 계산하는 함수
+
+    제목이 _PARALLEL_MIN_TITLES 이상이면 ProcessPoolExecutor로 코어별 분할 집계 후
+    Counter 합산, 그 미만이면 단일 프로세스에서 한 번에 처리
+    """
+    titles = list(news_titles)
+    workers = min(os.cpu_count() or 1, 8)
+
+    if len(titles) >= _PARALLEL_MIN_TITLES and workers > 1:
+        chunks = [titles[i::workers] for i in range(workers)]
+        # ✅ fork로는 부모가 이미 띄운 JVM(_TAGGER)이 워커에 복제돼 멈추므로 spawn으로 새 프로세스 시작
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            return sum(executor.map(_count_titles_chunk, chunks), Counter())
+
+    return _count_titles_chunk(titles)
+
+# ✅ 워드 클라우드 생성 함수 (빈도수 높은 단어 자동 제거 추가, 예외 처리)
+def create_wordcloud(news_titles, top_n_stopwords=5):
+    """ 크롤링한 뉴스 제목을 활용하여 가독성 높은 워드 클라우드를 생성하는 함수 """
+    # ✅ 명사 추출 + 불용어 제거 + 한 글자 단어 제외 + 빈도 집계 (대량이면 병렬)
+    word_freq = _count_titles(news_titles)
+
+    # ✅ 상위 N개 단어 자동 불용어 추가 (단, EXCLUDED_KEYWORDS는 제외)
+    common_words = {word for word, _ in word_freq.most_common(top_n_stopwords) if word not in EXCLUDED_KEYWORDS}
+    filtered_word_freq = {word: freq for word, freq in word_freq.items() if word not in common_words}
+
+    logging.info(f"🛑 자동으로 제외된 상위 {top_n_stopwords}개 단어 (단, {EXCLUDED_KEYWORDS} 제외): {common_words}")
+
+    # ✅ 미리 만들어 둔 엔진으로 빈도 기반 워드 클라우드 생성
+    wordcloud = _WORDCLOUD.generate_from_frequencies(filtered_word_freq)
+
+    # ✅ 워드 클라우드 출력
+    plt.figure(figsize=(12, 6))
+    plt.imshow(wordcloud, interpolation="bilinear")
+    plt.axis("off")
+    plt.show()
+
+# ✅ 실행 코드
+if __name__ == "__main__":
+    start_date = datetime(2025, 1, 1)
+    end_date = datetime(2025, 2, 7)
+
+    news_titles = asyncio.run(get_news_titles_by_date(start_date, end_date))
+
+    logging.info(f"\n📢 네이버 경제 뉴스 헤드라인 ({start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}):")
+    print("\n".join(f"{i + 1}. {title}" for i, title in enumerate(islice(news_titles, 20))))
+
+    create_wordcloud(news_titles)